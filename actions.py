@@ -1,26 +1,42 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import color
 import exceptions
-from entity import Actor
 
 if TYPE_CHECKING:
     from engine import Engine
     from entity import Actor, Entity, Item
+    from game_map import GameMap
 
 
 class Action:
+    # Actions are created every turn, so avoid a per-instance __dict__.
+    __slots__ = ("entity",)
+
     def __init__(self, entity: Actor) -> None:
         super().__init__()
         self.entity = entity
 
+    def __setstate__(self, state: Any) -> None:
+        # Saves from before __slots__ hold every attribute in a plain dict, which
+        # would otherwise end up in a subclass __dict__ hidden behind the slots.
+        if isinstance(state, tuple):
+            state, slots = state
+            state = {**(state or {}), **slots}
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @property
     def engine(self) -> Engine:
         """Return the engine this action belongs to."""
         return self.entity.gamemap.engine
 
+    def bind(self, entity: Actor) -> None:
+        """Rebind this action to `entity`, so a pooled action can be reused."""
+        self.entity = entity
+
     def perform(self) -> None:
         """Perform this action with the objects needed to determine its scope.
 
@@ -36,32 +52,34 @@ class Action:
 class PickupAction(Action):
     """Pickup an item and add it to the inventory, if there is room for it."""
 
+    __slots__ = ()
+
     def __init__(self, entity: Actor) -> None:
         super().__init__(entity)
 
     def perform(self) -> None:
-        actor_location_x = self.entity.x
-        actor_location_y = self.entity.y
-        inventory = self.entity.inventory
-
-        for item in self.engine.game_map.items:
-            if actor_location_x == item.x and actor_location_y == item.y:
-                return self.attempt_pickup(inventory, item)
-        raise exceptions.Impossible("There is nothing here to pick up.")
+        entity = self.entity
+        item = self.engine.game_map.get_item_at_location(entity.x, entity.y)
+        if item is None:
+            raise exceptions.Impossible("There is nothing here to pick up.")
+        return self.attempt_pickup(entity.inventory, item)
 
     def attempt_pickup(self, inventory, item) -> None:
         if len(inventory.items) >= inventory.capacity:
             raise exceptions.Impossible("Your inventory is full.")
 
-        self.engine.game_map.entities.remove(item)
-        item.parent = self.entity.inventory  # .parent?
+        engine = self.engine
+        engine.game_map.remove_entity(item)
+        item.parent = inventory
         inventory.items.append(item)
 
-        self.engine.message_log.add_message(f"You picked up the {item.name}!")
+        engine.message_log.add_message(f"You picked up the {item.name}!")
         return
 
 
 class ItemAction(Action):
+    __slots__ = ("item", "target_xy")
+
     def __init__(
         self, entity: Actor, item: Item, target_xy: tuple[int, int] | None = None
     ) -> None:
@@ -82,16 +100,22 @@ class ItemAction(Action):
 
 
 class DropItem(ItemAction):
+    __slots__ = ()
+
     def perform(self) -> None:
         self.entity.inventory.drop(self.item)
 
 
 class WaitAction(Action):
+    __slots__ = ()
+
     def perform(self) -> None:
         pass
 
 
 class TakeStairsAction(Action):
+    __slots__ = ()
+
     def perform(self) -> None:
         """
         Take the stairs, if any exist at the entity's location.
@@ -109,74 +133,94 @@ class TakeStairsAction(Action):
 
 
 class ActionWithDirection(Action):
+    __slots__ = ("dx", "dy", "dest_xy")
+
     def __init__(self, entity: Actor, dx: int, dy: int) -> None:
         super().__init__(entity)
 
         self.dx = dx
         self.dy = dy
+        # This actions destination, fixed when the action is created or rebound.
+        self.dest_xy = entity.x + dx, entity.y + dy
 
-    @property
-    def dest_xy(self) -> tuple[int, int]:
-        """Returns this actions destination."""
-        return self.entity.x + self.dx, self.entity.y + self.dy
+    def bind(self, entity: Actor) -> None:
+        """Rebind this action to `entity`, recomputing its destination."""
+        super().bind(entity)
+        self.dest_xy = entity.x + self.dx, entity.y + self.dy
 
-    @property
-    def blocking_entity(self) -> Entity | None:
-        """Return the blocking entity at this actions destination.."""
-        return self.engine.game_map.get_blocking_entity_at_location(*self.dest_xy)
-
-    @property
-    def target_actor(self) -> Actor | None:
-        """Return the actor at this actions destination."""
-        return self.engine.game_map.get_actor_at_location(*self.dest_xy)
+    def resolve_targets(self, game_map: GameMap) -> tuple[Actor | None, Entity | None]:
+        """Return the actor and the blocking entity at this actions destination."""
+        return game_map.get_targets_at_location(*self.dest_xy)
 
     def perform(self) -> None:
         raise NotImplementedError()
 
-
-class MeleeAction(ActionWithDirection):
-    def perform(self) -> None:
-        if not (target := self.target_actor):
-            raise exceptions.Impossible("Nothing to attack.")
-        damage = self.entity.fighter.power - target.fighter.defense
-
-        attack_desc = f"{self.entity.name.capitalize()} attacks {target.name}"
-        attack_color = (
-            color.player_atk if self.entity is self.engine.player else color.enemy_atk
-        )
+    def _do_melee(self, target: Actor) -> None:
+        """Attack `target`, which has already been resolved by the caller."""
+        attacker = self.entity
+        damage = attacker.fighter.power - target.fighter.defense
+        attack_color = color.player_atk if attacker.is_player else color.enemy_atk
 
         if damage > 0:
-
             self.engine.message_log.add_message(
-                f"{attack_desc} for {damage} hit points.", attack_color
+                f"{attacker.capitalized_name} attacks {target.name} "
+                f"for {damage} hit points.",
+                attack_color,
             )
             target.fighter.hp -= damage
         else:
             self.engine.message_log.add_message(
-                f"{attack_desc} but does no damage.", attack_color
+                f"{attacker.capitalized_name} attacks {target.name} "
+                "but does no damage.",
+                attack_color,
             )
 
+    def _do_move(self, game_map: GameMap, blocker: Entity | None) -> None:
+        """Move to this actions destination, given the blocking entity found there."""
+        dest_x, dest_y = self.dest_xy
+
+        # The destination must be in bounds, walkable, and free of blocking entities.
+        if (
+            blocker is None
+            and 0 <= dest_x < game_map.width
+            and 0 <= dest_y < game_map.height
+            and game_map.walkable[dest_x, dest_y]
+        ):
+            entity = self.entity
+            entity.move(self.dx, self.dy)
+            if entity.is_player:
+                game_map.engine.fov_dirty = True
+            return
+        raise exceptions.Impossible("That way is blocked.")
+
+
+class MeleeAction(ActionWithDirection):
+    __slots__ = ()
 
-class MovementAction(ActionWithDirection):
     def perform(self) -> None:
-        dest_x, dest_y = self.dest_xy
+        game_map = self.engine.game_map
+        if not (target := game_map.get_actor_at_location(*self.dest_xy)):
+            raise exceptions.Impossible("Nothing to attack.")
+        self._do_melee(target)
 
-        if not self.engine.game_map.in_bounds(dest_x, dest_y):
-            # Destination out of bounds
-            raise exceptions.Impossible("That way is blocked.")
-        if not self.engine.game_map.tiles["walkable"][dest_x, dest_y]:
-            # Destination is blocked by a tile
-            raise exceptions.Impossible("That was is blocked.")
-        if self.engine.game_map.get_blocking_entity_at_location(dest_x, dest_y):
-            # Destination is blocked by an entity
-            raise exceptions.Impossible("That way is blocked.")
 
-        self.entity.move(self.dx, self.dy)
+class MovementAction(ActionWithDirection):
+    __slots__ = ()
+
+    def perform(self) -> None:
+        game_map = self.engine.game_map
+        self._do_move(
+            game_map, game_map.get_blocking_entity_at_location(*self.dest_xy)
+        )
 
 
 class BumpAction(ActionWithDirection):
+    __slots__ = ()
+
     def perform(self) -> None:
-        if self.target_actor:
-            return MeleeAction(self.entity, self.dx, self.dy).perform()
+        game_map = self.engine.game_map
+        target, blocker = self.resolve_targets(game_map)
+        if target:
+            return self._do_melee(target)
         else:
-            return MovementAction(self.entity, self.dx, self.dy).perform()
+            return self._do_move(game_map, blocker)
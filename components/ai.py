@@ -7,7 +7,6 @@ import numpy as np
 import tcod
 
 from actions import Action, BumpAction, MeleeAction, MovementAction, WaitAction
-from entity import Actor
 
 if TYPE_CHECKING:
     from entity import Actor
@@ -19,6 +18,13 @@ class BaseAI(Action):
     def perform(self) -> None:
         raise NotImplementedError()
 
+    def is_idle(self, in_view: bool) -> bool:
+        """Return True if performing this AI would do nothing this turn.
+
+        `in_view` is whether the entity is in the player's field of view.
+        """
+        return False
+
     def get_path_to(self, dest_x: int, dest_y: int) -> list[tuple[int, int]]:
         """
         Compute and return a path to the target position.
@@ -26,7 +32,7 @@ class BaseAI(Action):
         If there is no valid path then returns an empty list.
         """
         # Copy the walkable array
-        cost = np.array(self.entity.gamemap.tiles["walkable"], dtype=np.int8)
+        cost = np.array(self.entity.gamemap.walkable, dtype=np.int8)
 
         for entity in self.entity.gamemap.entities:
             # Check that an enitiy blocks movement and the cost isn't zero (blocking.)
@@ -121,3 +127,7 @@ class HostileEnemy(BaseAI):
             ).perform()
 
         return WaitAction(self.entity).perform()
+
+    def is_idle(self, in_view: bool) -> bool:
+        """An enemy out of view with no path left to follow just waits."""
+        return not in_view and not self.path
@@ -8,7 +8,6 @@ import components.ai
 import components.inventory
 from actions import Action, ItemAction
 from components.base_component import BaseComponent
-from entity import Actor
 from exceptions import Impossible
 from input_handlers import (
     ActionOrHandler,
@@ -37,12 +37,16 @@ class Fighter(BaseComponent):
             death_message = f"{self.parent.name} is dead!"
             death_message_color = color.enemy_die
 
+        # The corpse stops blocking and acting, so take it out of the indexes first.
+        self.gamemap.unindex_entity(self.parent)
         self.parent.char = "%"
         self.parent.color = (191, 0, 0)
         self.parent.blocks_movement = False
         self.parent.ai = None
         self.parent.name = f"remains of {self.parent.name}"
+        self.parent.capitalized_name = self.parent.name.capitalize()
         self.parent.render_order = RenderOrder.CORPSE
+        self.gamemap.index_entity(self.parent)
 
         self.engine.message_log.add_message(death_message, death_message_color)
         
@@ -3,13 +3,15 @@ from __future__ import annotations
 import contextlib
 import lzma
 import pickle
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from tcod.console import Console
 from tcod.map import compute_fov
 
 import exceptions
 import render_functions
+from actions import BumpAction, WaitAction
 from message_log import MessageLog
 
 if TYPE_CHECKING:
@@ -20,15 +22,63 @@ if TYPE_CHECKING:
 class Engine:
     game_map: GameMap
     game_world: GameWorld
+    # Set when the player moves or the map changes, so FOV is only recomputed then.
+    fov_dirty = True
 
     def __init__(self, player: Actor) -> None:
         self.message_log = MessageLog()
         self.mouse_location: tuple[int, int] = (0, 0)
         self.player = player
+        player.is_player = True
+        # Player actions reused between keypresses, rebound to the player on use.
+        self._bump_actions: dict[tuple[int, int], BumpAction] = {}
+        self._wait_action: WaitAction | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        # Pooled actions are rebuilt on demand, so they aren't saved.
+        del state["_bump_actions"]
+        del state["_wait_action"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._bump_actions = {}
+        self._wait_action = None
+        # Every entity has been restored by now, so the map can index them again.
+        self.game_map.rebuild_indexes()
+        self.player.is_player = True  # Saves may predate this flag.
+
+    def pooled_bump_action(self, dx: int, dy: int) -> BumpAction:
+        """Return the shared BumpAction for this direction, bound to the player."""
+        action = self._bump_actions.get((dx, dy))
+        if action is None:
+            action = self._bump_actions[dx, dy] = BumpAction(self.player, dx, dy)
+        else:
+            action.bind(self.player)
+        return action
+
+    def pooled_wait_action(self) -> WaitAction:
+        """Return the shared WaitAction, bound to the player."""
+        if self._wait_action is None:
+            self._wait_action = WaitAction(self.player)
+        else:
+            self._wait_action.bind(self.player)
+        return self._wait_action
 
     def handle_enemy_turns(self) -> None:
-        for entity in set(self.game_map.actors) - {self.player}:
-            if entity.ai:
+        enemies = [actor for actor in self.game_map.actors if actor is not self.player]
+        if not enemies:
+            return
+
+        # Look up every enemy's visibility at once, so idle enemies can be skipped.
+        count = len(enemies)
+        xs = np.fromiter((actor.x for actor in enemies), dtype=np.intp, count=count)
+        ys = np.fromiter((actor.y for actor in enemies), dtype=np.intp, count=count)
+        in_view = self.game_map.visible[xs, ys].tolist()
+
+        for entity, entity_in_view in zip(enemies, in_view):
+            if entity.ai and not entity.ai.is_idle(entity_in_view):
                 with contextlib.suppress(
                     exceptions.Impossible
                 ):  # Ignore imporssible action exceptions from AI.
@@ -41,6 +91,7 @@ class Engine:
             (self.player.x, self.player.y),
             radius=8,
         )
+        self.fov_dirty = False
         # If a tile is "visible" it should be added to "explored".
         self.game_map.explored |= self.game_map.visible
 
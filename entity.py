@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import copy
 import math
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from render_order import RenderOrder
 
@@ -45,7 +45,7 @@ class Entity:
         if parent:
             # If parent isn't provided now then it will be set later.
             self.parent = parent
-            parent.entities.add(self)
+            parent.add_entity(self)
 
     @property
     def gamemap(self) -> GameMap:
@@ -57,18 +57,27 @@ class Entity:
         clone.x = x
         clone.y = y
         clone.parent = gamemap
-        gamemap.entities.add(clone)
+        gamemap.add_entity(clone)
         return clone
 
     def place(self, x: int, y: int, gamemap: GameMap | None = None) -> None:
         """Place this entity at a new location.  Handles moving across GameMaps."""
-        self.x = x
-        self.y = y
         if gamemap:
             if hasattr(self, "parent") and self.parent is self.gamemap:
-                self.gamemap.entities.remove(self)
+                self.gamemap.remove_entity(self)
+            self.x = x
+            self.y = y
             self.parent = gamemap
-            gamemap.entities.add(self)
+            gamemap.add_entity(self)
+        elif hasattr(self, "parent") and self.parent is self.gamemap:
+            # Moving within the current map, so keep its location indexes in sync.
+            self.gamemap.unindex_entity(self)
+            self.x = x
+            self.y = y
+            self.gamemap.index_entity(self)
+        else:
+            self.x = x
+            self.y = y
 
     def distance(self, x: int, y: int) -> float:
         """
@@ -78,11 +87,17 @@ class Entity:
 
     def move(self, dx: int, dy: int) -> None:
         # Move the entity by a given amount
+        gamemap = self.gamemap
+        gamemap.unindex_entity(self)
         self.x += dx
         self.y += dy
+        gamemap.index_entity(self)
 
 
 class Actor(Entity):
+    # Set by the Engine which takes this actor as its player.
+    is_player = False
+
     def __init__(
         self,
         *,
@@ -106,6 +121,9 @@ class Actor(Entity):
             render_order=RenderOrder.ACTOR,
         )
 
+        # Cached for attack messages, kept in sync by Fighter.die.
+        self.capitalized_name = name.capitalize()
+
         self.ai: BaseAI | None = ai_cls(self)
 
         self.fighter = fighter
@@ -117,6 +135,11 @@ class Actor(Entity):
         self.level = level
         self.level.parent = self
 
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if "capitalized_name" not in state:  # Saved before the name was cached.
+            self.capitalized_name = self.name.capitalize()
+
     @property
     def is_alive(self) -> bool:
         """Returns True as long as this actor can perform actions."""
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
 import numpy as np
 from tcod.console import Console
@@ -19,8 +19,17 @@ class GameMap:
     ) -> None:
         self.engine = engine
         self.width, self.height = width, height
-        self.entities = set(entities)
+        self.entities: set[Entity] = set()
+        # Spatial indexes keyed by (x, y), kept in sync as entities move around.
+        self._items_by_xy: dict[tuple[int, int], list[Item]] = {}
+        # Living actors always block movement, so this also serves as the actor index.
+        self._blockers_at: dict[tuple[int, int], Entity] = {}
+        for entity in entities:
+            self.add_entity(entity)
         self.tiles = np.full((width, height), fill_value=tile_types.wall, order="F")
+        # A view of the "walkable" field, so it isn't rebuilt on every lookup.
+        # Tiles are only ever modified in place, which keeps this view current.
+        self.walkable = self.tiles["walkable"]
 
         self.visible = np.full(
             (width, height), fill_value=False, order="F"
@@ -31,6 +40,29 @@ class GameMap:
 
         self.downstairs_location: tuple[int, int] = (0, 0)
 
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["walkable"]  # Pickling a view would save a detached copy.
+        # The location indexes are derived from `entities` and rebuilt on load.
+        del state["_items_by_xy"]
+        del state["_blockers_at"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.walkable = self.tiles["walkable"]
+        # Entities may not be restored yet, since they refer back to this map.
+        # The Engine rebuilds the indexes once loading has finished.
+        self._items_by_xy = {}
+        self._blockers_at = {}
+
+    def rebuild_indexes(self) -> None:
+        """Rebuild the location indexes from `entities`."""
+        self._items_by_xy = {}
+        self._blockers_at = {}
+        for entity in self.entities:
+            self.index_entity(entity)
+
     @property
     def gamemap(self) -> GameMap:
         return self
@@ -46,28 +78,65 @@ class GameMap:
 
     @property
     def items(self) -> Iterator[Item]:
-        yield from (entity for entity in self.entities if isinstance(entity, Item))
+        for bucket in self._items_by_xy.values():
+            yield from bucket
+
+    def add_entity(self, entity: Entity) -> None:
+        """Add an entity to this map, indexing it at its current location."""
+        self.entities.add(entity)
+        self.index_entity(entity)
+
+    def remove_entity(self, entity: Entity) -> None:
+        """Remove an entity from this map, along with its location index."""
+        self.entities.remove(entity)
+        self.unindex_entity(entity)
+
+    def index_entity(self, entity: Entity) -> None:
+        """Record an entity at its current location in the spatial indexes."""
+        xy = entity.x, entity.y
+        if isinstance(entity, Item):
+            self._items_by_xy.setdefault(xy, []).append(entity)
+        if entity.blocks_movement:
+            self._blockers_at[xy] = entity
+
+    def unindex_entity(self, entity: Entity) -> None:
+        """Forget an entity at its current location in the spatial indexes.
+
+        This must be called before the entity's position or state changes.
+        """
+        xy = entity.x, entity.y
+        bucket = self._items_by_xy.get(xy)
+        if bucket and entity in bucket:
+            bucket.remove(entity)
+            if not bucket:
+                del self._items_by_xy[xy]
+        if self._blockers_at.get(xy) is entity:
+            del self._blockers_at[xy]
+
+    def get_item_at_location(self, x: int, y: int) -> Item | None:
+        """Return the first item at this location, if there is one."""
+        bucket = self._items_by_xy.get((x, y))
+        return bucket[0] if bucket else None
 
     def get_blocking_entity_at_location(
         self, location_x: int, location_y: int
     ) -> Entity | None:
-        return next(
-            (
-                entity
-                for entity in self.entities
-                if (
-                    entity.blocks_movement
-                    and entity.x == location_x
-                    and entity.y == location_y
-                )
-            ),
-            None,
-        )
+        return self._blockers_at.get((location_x, location_y))
 
     def get_actor_at_location(self, x: int, y: int) -> Actor | None:
-        return next(
-            (actor for actor in self.actors if actor.x == x and actor.y == y), None
-        )
+        return self.get_targets_at_location(x, y)[0]
+
+    def get_targets_at_location(
+        self, x: int, y: int
+    ) -> tuple[Actor | None, Entity | None]:
+        """Return the living actor and the blocking entity at this location.
+
+        Both come from a single probe of the blocker index.
+        """
+        blocker = self._blockers_at.get((x, y))
+        if isinstance(blocker, Actor) and blocker.is_alive:
+            return blocker, blocker
+        return None, blocker
 
     def in_bounds(self, x: int, y: int) -> bool:
         """Return True if x and y are inside of the bounds of this map."""
@@ -140,3 +209,4 @@ class GameWorld:
             map_height=self.map_height,
             engine=self.engine,
         )
+        self.engine.fov_dirty = True
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Callable, Union
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Union
 
 import tcod
 from tcod import libtcodpy
@@ -9,11 +9,11 @@ from tcod import libtcodpy
 import actions
 import color
 import exceptions
-from actions import Action, BumpAction, PickupAction, WaitAction
+from actions import Action, PickupAction
 
 if TYPE_CHECKING:
     from engine import Engine
-    from entity import Item
+    from entity import Actor, Item
 
 
 MOVE_KEYS = {
@@ -64,6 +64,30 @@ WAIT_KEYS = {
     tcod.event.KeySym.CLEAR,
 }
 
+
+def _bump_factory(dx: int, dy: int) -> Callable[[Engine], Action]:
+    """Return a callable giving the pooled BumpAction for this direction."""
+    return lambda engine: engine.pooled_bump_action(dx, dy)
+
+
+def _wait(engine: Engine) -> Action:
+    """Return the pooled WaitAction."""
+    return engine.pooled_wait_action()
+
+
+def _pickup(engine: Engine) -> Action:
+    """Return a PickupAction for the player."""
+    return PickupAction(engine.player)
+
+
+# Main game keys which map directly to a player action, keyed by integer key symbol.
+_KEY_DISPATCH: dict[int, Callable[[Engine], Action]] = {
+    **{key.value: _bump_factory(dx, dy) for key, (dx, dy) in MOVE_KEYS.items()},
+    **{key.value: _wait for key in WAIT_KEYS},
+    tcod.event.KeySym.g.value: _pickup,
+}
+
+
 ActionOrHandler = Union[Action, "BaseEventHandler"]
 """An event handler return value which can trigger an action or switch active handlers.
 
@@ -73,14 +97,53 @@ MainGameEventHandler will become the active handler.
 """
 
 
+def coalesce_key_repeats(
+    events: Iterable[tcod.event.Event],
+) -> Iterator[tuple[tcod.event.Event, int]]:
+    """Fold runs of autorepeated movement keys into a single event.
+
+    Yields each event along with the number of times it was sent in a row.
+    Text input events from the repeated key don't break up a run.
+    """
+    pending: tcod.event.KeyDown | None = None
+    count = 0
+    for event in events:
+        if pending is not None:
+            if (
+                isinstance(event, tcod.event.KeyDown)
+                and event.repeat
+                and event.sym == pending.sym
+                and event.mod == pending.mod
+            ):
+                count += 1
+                continue
+            if isinstance(event, tcod.event.TextInput):
+                yield event, 1
+                continue
+            yield pending, count
+            pending = None
+        if isinstance(event, tcod.event.KeyDown) and event.sym in MOVE_KEYS:
+            pending, count = event, 1
+        else:
+            yield event, 1
+    if pending is not None:
+        yield pending, count
+
+
 class BaseEventHandler(tcod.event.EventDispatch[ActionOrHandler]):
-    def handle_events(self, event: tcod.event.Event) -> BaseEventHandler:
-        """Handle an event and return the next axctive event handler."""
+    def handle_events(
+        self, event: tcod.event.Event, repeat: int = 1
+    ) -> BaseEventHandler:
+        """Handle an event and return the next axctive event handler.
+
+        `repeat` is how many times a held key sent this event.  Each repeat is
+        handled by whichever handler is active by then.
+        """
         state = self.dispatch(event)
         if isinstance(state, BaseEventHandler):
-            return state
+            return state.handle_events(event, repeat - 1) if repeat > 1 else state
         assert not isinstance(state, Action), f"{self!r} can not handle actions."
-        return self
+        return self.handle_events(event, repeat - 1) if repeat > 1 else self
 
     def on_render(self, console: tcod.console.Console) -> None:
         raise NotImplementedError()
@@ -120,21 +183,68 @@ class EventHandler(BaseEventHandler):
     def __init__(self, engine: Engine) -> None:
         self.engine = engine
 
-    def handle_events(self, event: tcod.event.Event) -> BaseEventHandler:
-        """Handle events for unput handlers with an engine"""
-        action_or_state = self.dispatch(event)
-        if isinstance(action_or_state, BaseEventHandler):
-            return action_or_state
-        if self.handle_action(action_or_state):
+    def handle_events(
+        self, event: tcod.event.Event, repeat: int = 1
+    ) -> BaseEventHandler:
+        """Handle events for unput handlers with an engine
+
+        `repeat` is how many times a held key sent this event.  Each repeat is
+        handled by whichever handler is active by then.  A held key on the main
+        game screen stops early if an action fails, the player dies or levels up,
+        or a new enemy comes into view.
+        """
+        enemies_in_view = self.visible_enemies() if repeat > 1 else set()
+        acted = False
+        while repeat > 0:
+            repeat -= 1
+            action_or_state = self.dispatch(event)
+            if isinstance(action_or_state, BaseEventHandler):
+                if repeat:
+                    return action_or_state.handle_events(event, repeat)
+                return action_or_state
+            if action_or_state is None:
+                continue
+            if not self.handle_action(action_or_state):
+                break
             # A valid action was performed.
+            acted = True
             if not self.engine.player.is_alive:
                 # The player was killed sometimes during or after the action.
                 return GameOverEventHandler(self.engine)
             elif self.engine.player.level.requires_level_up:
                 return LevelUpEventHandler(self.engine)
+            if not isinstance(self, MainGameEventHandler):
+                # Any remaining repeats go to the main handler, as they would unbatched.
+                next_handler = MainGameEventHandler(self.engine)
+                if repeat:
+                    return next_handler.handle_events(event, repeat)
+                return next_handler
+            if repeat and self.spotted_new_enemy(enemies_in_view):
+                break  # Stop a held key when a new enemy is spotted.
+        if acted:
             return MainGameEventHandler(self.engine)  # Return to the main handler
         return self
 
+    def visible_enemies(self) -> set[Actor]:
+        """Return the living actors other than the player which are in view."""
+        game_map = self.engine.game_map
+        return {
+            actor
+            for actor in game_map.actors
+            if actor is not self.engine.player and game_map.visible[actor.x, actor.y]
+        }
+
+    def spotted_new_enemy(self, enemies_in_view: set[Actor]) -> bool:
+        """Return True if an enemy not in `enemies_in_view` is now in view."""
+        game_map = self.engine.game_map
+        visible = game_map.visible
+        return any(
+            actor not in enemies_in_view
+            and not actor.is_player
+            and visible[actor.x, actor.y]
+            for actor in game_map.actors
+        )
+
     def handle_action(self, action: Action | None) -> bool:
         """Handle actions returned from event methods.
 
@@ -151,7 +261,8 @@ class EventHandler(BaseEventHandler):
 
         self.engine.handle_enemy_turns()
 
-        self.engine.update_fov()
+        if self.engine.fov_dirty:
+            self.engine.update_fov()
         return True
 
     def ev_mousemotion(self, event: tcod.event.MouseMotion) -> None:
@@ -164,8 +275,6 @@ class EventHandler(BaseEventHandler):
 
 class MainGameEventHandler(EventHandler):
     def ev_keydown(self, event: tcod.event.KeyDown) -> ActionOrHandler | None:
-        action: Action | None = None
-
         key = event.sym
         modifier = event.mod
 
@@ -176,22 +285,16 @@ class MainGameEventHandler(EventHandler):
         ):
             return actions.TakeStairsAction(player)
 
-        if key in MOVE_KEYS:
-            dx, dy = MOVE_KEYS[key]
-            action = BumpAction(player, dx=dx, dy=dy)
-
-        elif key in WAIT_KEYS:
-            action = WaitAction(player)
+        action_factory = _KEY_DISPATCH.get(int(key))
+        if action_factory is not None:
+            return action_factory(self.engine)
 
-        elif key == tcod.event.KeySym.ESCAPE:
+        if key == tcod.event.KeySym.ESCAPE:
             raise SystemExit()
 
         elif key == tcod.event.KeySym.v:
             return HistoryViewer(self.engine)
 
-        elif key == tcod.event.KeySym.g:
-            action = PickupAction(player)
-
         elif key == tcod.event.KeySym.i:
             return InventoryActivateHandler(self.engine)
 
@@ -205,7 +308,7 @@ class MainGameEventHandler(EventHandler):
             return LookHandler(self.engine)
 
         # No valid key was pressed
-        return action
+        return None
 
 
 class GameOverEventHandler(EventHandler):
@@ -42,9 +42,10 @@ def main():
                 context.present(root_console)
 
                 try:
-                    for event in tcod.event.wait():
+                    events = input_handlers.coalesce_key_repeats(tcod.event.wait())
+                    for event, repeat in events:
                         context.convert_event(event)
-                        handler = handler.handle_events(event)
+                        handler = handler.handle_events(event, repeat)
                 except Exception:  # Handle exceptions in game.
                     traceback.print_exc()  # Print error to stderr.
                     # Then print the error to the message log.
@@ -159,7 +159,8 @@ def generate_dungeon(
 ) -> GameMap:
     """Generate a new dungeon map."""
     player = engine.player
-    dungeon = GameMap(engine, map_width, map_height, entities=[player])
+    # The player is added to the map when it is placed in the first room.
+    dungeon = GameMap(engine, map_width, map_height)
 
     rooms: list[RectangularRoom] = []
 